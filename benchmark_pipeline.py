@@ -0,0 +1,229 @@
+"""
+Benchmark + smoke test للـ CandidatePipeline
+
+يشغل الـ pipeline على أحداث وهمية من Reddit و Discord بدون شبكة:
+send_telegram_message و extract_text_from_image يتم استبدالهما بدوال محلية.
+
+1. Smoke test: تصفية التكرار، الروابط، والعدادات لكل مصدر
+2. Latency: كود نصي من Discord لا ينتظر OCR بطيء لصور Reddit
+3. process_batch: توقيت المسار الساخن مباشرة
+4. Worker: توقيت submit -> الطابور -> run() مع OCR متأخر
+
+الاستخدام:
+    python benchmark_pipeline.py [events] [rounds] [ocr_delay]
+
+يخرج بكود غير صفري إذا فشل أي فحص.
+"""
+import io
+import os
+import sys
+import time
+from contextlib import redirect_stdout
+from threading import Thread
+
+# قيم وهمية حتى يتم تحميل reddit_monitor بدون متغيرات البيئة الحقيقية
+os.environ.setdefault('REDDIT_CLIENT_ID', 'benchmark')
+os.environ.setdefault('REDDIT_SECRET', 'benchmark')
+
+import reddit_monitor as monitor
+
+SAMPLE_TEXTS = [
+    "Here is my code A1B2C3 please use it",
+    "Thanks everyone! PLEASE share more codes",
+    "Anyone got one? 123456 did not work",
+    "Fresh one: Q7W8E9 and another X1Y2Z3",
+    "Just a normal comment without anything useful",
+]
+
+OCR_CODE = "X9Y8Z7"
+
+# الأكواد المرسلة: (code, url, source_name, send_time)
+sent = []
+ocr_delay = 0.0
+
+def fake_send(code, source_url="", seconds_ago=0, source_emoji="", source_name=""):
+    sent.append((code, source_url, source_name, time.perf_counter()))
+    return True
+
+def fake_ocr(image_url):
+    if ocr_delay:
+        time.sleep(ocr_delay)
+    monitor.stats['images_scanned'] += 1
+    return f"IMG CODE {OCR_CODE}"
+
+def check(condition, message):
+    """فحص لا يتم تجاهله مع python -O"""
+    if not condition:
+        print(f"FAIL: {message}")
+        sys.exit(1)
+
+def wait_for(predicate, timeout):
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.001)
+    return predicate()
+
+def new_pipeline():
+    return monitor.CandidatePipeline([
+        monitor.RedditAdapter("https://www.reddit.com/r/test/comments/benchmark/"),
+        monitor.DiscordAdapter(None, 0),
+    ])
+
+def start_worker(pipeline):
+    """تشغيل worker الـ pipeline في الخلفية (ينتهي مع نهاية السكربت)"""
+    Thread(target=pipeline.run, daemon=True).start()
+
+def drain(pipeline):
+    """انتظار انتهاء كل الأحداث، بما فيها نتائج OCR الراجعة للطابور"""
+    pipeline.queue.join()
+    pipeline.ocr_queue.join()
+    pipeline.queue.join()
+
+def reset_state():
+    sent.clear()
+    monitor.sent_codes.clear()
+    monitor.stats['codes_sent'] = 0
+    monitor.stats['codes_rejected'] = 0
+    monitor.stats['images_scanned'] = 0
+    monitor.stats['codes_list'] = []
+    for source in ('reddit', 'discord'):
+        monitor.stats[f"{source}_codes"] = 0
+
+def make_events(pipeline, count, base_index=0, with_images=True):
+    """إنشاء أحداث وهمية بالتناوب بين المصادر"""
+    adapters = list(pipeline.adapters.values())
+    now = time.time()
+    events = []
+
+    for i in range(count):
+        adapter = adapters[i % len(adapters)]
+        n = base_index + i
+        text = f"{SAMPLE_TEXTS[i % len(SAMPLE_TEXTS)]} Z{n % 100000:05d}"
+        image_urls = [f"https://i.redd.it/{n}.png"] if with_images and i % 10 == 0 else []
+        events.append(adapter.make_event(text, image_urls, f"https://example.com/{adapter.name}/{n}", now - 5))
+
+    return events
+
+def smoke_test():
+    """فحص سريع لصحة التصفية والروابط والعدادات عبر submit و run()"""
+    global ocr_delay
+    ocr_delay = 0.0
+    reset_state()
+
+    pipeline = new_pipeline()
+    reddit = pipeline.adapters['reddit']
+    discord = pipeline.adapters['discord']
+    now = time.time()
+
+    start_worker(pipeline)
+    with redirect_stdout(io.StringIO()):
+        pipeline.submit([
+            reddit.make_event("code A1B2C3 PLEASE A1B2C3", ["https://i.redd.it/x.png"], "https://reddit.com/r/x/1", now - 5),
+            discord.make_event("Q1W2E3", [], "https://discord.com/channels/1/2/3", now),
+        ])
+        drain(pipeline)
+
+    by_code = {code: (url, source_name) for code, url, source_name, _ in sent}
+    check(len(sent) == 3 and set(by_code) == {'A1B2C3', 'Q1W2E3', OCR_CODE}, f"unexpected codes {sent}")
+    check(by_code['A1B2C3'] == ("https://reddit.com/r/x/1", 'Reddit'), f"wrong Reddit code {by_code['A1B2C3']}")
+    check(by_code['Q1W2E3'] == ("https://discord.com/channels/1/2/3", 'Discord'), f"wrong Discord code {by_code['Q1W2E3']}")
+    check(by_code[OCR_CODE] == ("https://reddit.com/r/x/1", 'Reddit'), f"wrong OCR code {by_code[OCR_CODE]}")
+    check(monitor.stats['reddit_codes'] == 2, f"reddit_codes = {monitor.stats['reddit_codes']}")
+    check(monitor.stats['discord_codes'] == 1, f"discord_codes = {monitor.stats['discord_codes']}")
+    check(monitor.stats['codes_rejected'] == 1, f"codes_rejected = {monitor.stats['codes_rejected']}")
+    print("Smoke test: OK")
+
+def latency_test(delay):
+    """كود Discord نصي يجب أن يصل بينما OCR صور Reddit ما زال يعمل"""
+    global ocr_delay
+    ocr_delay = delay
+    reset_state()
+
+    pipeline = new_pipeline()
+    reddit = pipeline.adapters['reddit']
+    discord = pipeline.adapters['discord']
+    now = time.time()
+
+    start_worker(pipeline)
+    with redirect_stdout(io.StringIO()):
+        pipeline.submit([reddit.make_event("no code here", ["https://i.redd.it/1.png", "https://i.redd.it/2.png"], "r", now)])
+        time.sleep(0.05)
+
+        start = time.perf_counter()
+        pipeline.submit([discord.make_event("Q1W2E3", [], "d", now)])
+        got_code = wait_for(lambda: any(code == 'Q1W2E3' for code, _, _, _ in sent), delay * 2 + 1)
+        drain(pipeline)
+
+    check(got_code, "Discord text code was never sent")
+    latency = next(t for code, _, _, t in sent if code == 'Q1W2E3') - start
+    check(latency < delay / 2, f"Discord text code waited {latency:.3f}s behind {delay}s OCR")
+    print(f"Text latency with {delay}s OCR in flight: {latency * 1000:.2f} ms")
+
+def bench_process_batch(events_per_round, rounds):
+    """توقيت المسار الساخن بدون طوابير"""
+    global ocr_delay
+    ocr_delay = 0.0
+    timings = []
+
+    for r in range(rounds):
+        reset_state()
+        pipeline = new_pipeline()
+        events = make_events(pipeline, events_per_round, r * events_per_round, with_images=False)
+
+        with redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            pipeline.process_batch(events)
+            timings.append(time.perf_counter() - start)
+
+    report("process_batch", events_per_round, rounds, timings)
+
+def bench_worker(events_per_round, rounds, delay):
+    """توقيت submit -> run() مع OCR متأخر، وقياس زمن وصول الأكواد النصية"""
+    global ocr_delay
+    ocr_delay = delay
+    timings = []
+    text_timings = []
+
+    for r in range(rounds):
+        reset_state()
+        pipeline = new_pipeline()
+        events = make_events(pipeline, events_per_round, r * events_per_round)
+        start_worker(pipeline)
+
+        with redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            pipeline.submit(events)
+            pipeline.queue.join()
+            text_timings.append(time.perf_counter() - start)
+            drain(pipeline)
+            timings.append(time.perf_counter() - start)
+
+        images = sum(len(event.image_urls) for event in events)
+        check(monitor.stats['images_scanned'] == images, f"scanned {monitor.stats['images_scanned']} of {images} images")
+
+    report(f"worker text (OCR {delay}s)", events_per_round, rounds, text_timings)
+    report(f"worker total (OCR {delay}s)", events_per_round, rounds, timings)
+
+def report(name, events_per_round, rounds, timings):
+    best = min(timings)
+    print(f"[{name}] Events: {events_per_round} x {rounds} rounds")
+    print(f"    Best: {best * 1000:.2f} ms ({events_per_round / best:,.0f} events/s)")
+    print(f"    Mean: {sum(timings) / len(timings) * 1000:.2f} ms")
+
+def main():
+    events_per_round = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    delay = float(sys.argv[3]) if len(sys.argv) > 3 else 0.001
+
+    monitor.send_telegram_message = fake_send
+    monitor.extract_text_from_image = fake_ocr
+
+    smoke_test()
+    latency_test(0.5)
+    bench_process_batch(events_per_round, rounds)
+    bench_worker(events_per_round, rounds, delay)
+
+if __name__ == "__main__":
+    main()
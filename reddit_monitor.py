@@ -5,7 +5,8 @@ import time
 import requests
 from datetime import datetime
 import os
-from threading import Thread
+from threading import Thread, Lock
+from queue import Queue, Empty
 from http.server import HTTPServer, BaseHTTPRequestHandler
 import asyncio
 
@@ -24,6 +25,9 @@ stats = {
 
 # HTTP Server لـ Render Health Check
 class HealthCheckHandler(BaseHTTPRequestHandler):
+    # المحولات المسجلة في الـ pipeline (يتم تعيينها في __main__)
+    adapters = ()
+    
     def do_GET(self):
         self.send_response(200)
         self.send_header('Content-type', 'text/html; charset=utf-8')
@@ -45,6 +49,20 @@ class HealthCheckHandler(BaseHTTPRequestHandler):
         
         recent_codes = ", ".join(stats['codes_list'][-5:]) if stats['codes_list'] else "None"
         
+        source_rows = "".join(
+            f"""
+                        <div class="stat-row">
+                            <span class="stat-label">{adapter.label} Codes</span>
+                            <span class="stat-value">{stats.get(f'{adapter.name}_codes', 0)}</span>
+                        </div>"""
+            for adapter in self.adapters
+        )
+        
+        source_badges = "\n".join(
+            f'<span class="status-badge">{adapter.label.upper()} ACTIVE</span>'
+            for adapter in self.adapters
+        )
+        
         html = f"""
         <!DOCTYPE html>
         <html>
@@ -153,8 +171,7 @@ class HealthCheckHandler(BaseHTTPRequestHandler):
             <div class="container">
                 <h1>Multi-Source Sora Monitor</h1>
                 <div class="subtitle">
-                    <span class="status-badge">REDDIT ACTIVE</span>
-                    <span class="status-badge">DISCORD ACTIVE</span>
+                    {source_badges}
                     <br>Real-time OpenAI Sora 2 Invite Code Detection
                 </div>
                 
@@ -181,14 +198,7 @@ class HealthCheckHandler(BaseHTTPRequestHandler):
                             <span class="stat-label">Total Codes</span>
                             <span class="stat-value highlight">{stats['codes_sent']}</span>
                         </div>
-                        <div class="stat-row">
-                            <span class="stat-label">Reddit Codes</span>
-                            <span class="stat-value">{stats['reddit_codes']}</span>
-                        </div>
-                        <div class="stat-row">
-                            <span class="stat-label">Discord Codes</span>
-                            <span class="stat-value">{stats['discord_codes']}</span>
-                        </div>
+                        {source_rows}
                         <div class="stat-row">
                             <span class="stat-label">Success Rate</span>
                             <span class="stat-value">{success_rate:.1f}%</span>
@@ -264,11 +274,26 @@ OCR_ENABLED = True
 
 # Regex للبحث عن الأكواد
 CODE_PATTERN = re.compile(r'\b[A-Za-z0-9]{6}\b')
+URL_PATTERN = re.compile(r'https?://[^\s<>"{}|\\^`\[\]]+')
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.webp')
 
-# لتتبع الأكواد المرسلة
+CODE_BLACKLIST = frozenset({
+    'ANYONE', 'PLEASE', 'THANKS', 'UPDATE', 'POSTED', 'DELETE',
+    'THREAD', 'INVITE', 'WITHIN', 'SECOND', 'TRIPLE', 'PROMPT',
+    'OPENAI', 'REDDIT', 'REPORT', 'START', 'GIVING', 'TAKING',
+    'FRIEND', 'PEOPLE', 'PERSON', 'SINGLE', 'DOUBLE', 'FOLLOW',
+    'RECENT', 'RANDOM', 'PUBLIC', 'BUTTON', 'SUBMIT', 'CANCEL',
+    'TEST01', 'TEST02', 'DEMO01', 'SAMPLE', 'XXXXXX', 'ABCDEF',
+    '123456', 'ABC123', 'XYZ789', 'START1', 'ERROR1'
+})
+
+# لتتبع الأكواد المرسلة (يعدلها worker الـ pipeline فقط)
 sent_codes = set()
-processed_comments = set()
-processed_discord_messages = set()
+stats_lock = Lock()
+
+# إعادة المحاولة عند فشل اتصال مصدر (بالثواني)
+RETRY_DELAY = 60
+MAX_RETRY_DELAY = 600
 
 def extract_text_from_image(image_url):
     """استخراج النص من الصورة"""
@@ -309,16 +334,13 @@ def extract_text_from_image(image_url):
     except Exception as e:
         return ""
 
-def send_telegram_message(code, source_url="", seconds_ago=0, source="reddit"):
+def send_telegram_message(code, source_url="", seconds_ago=0, source_emoji="🔴", source_name="Reddit"):
     """إرسال رسالة إلى Telegram"""
     url = f"https://api.telegram.org/bot{TELEGRAM_TOKEN}/sendMessage"
     
     if code in ["REPORT", "START"]:
         return True
     
-    source_emoji = "🔴" if source == "reddit" else "💜"
-    source_name = "Reddit" if source == "reddit" else "Discord"
-    
     message = f"🎯 <b>SORA 2 INVITE CODE DETECTED</b>\n"
     message += f"{'='*30}\n"
     message += f"🔑 Code: <code>{code}</code>\n"
@@ -355,17 +377,7 @@ def is_valid_code(code):
     if not (has_letter and has_digit):
         return False, "not_mixed"
     
-    blacklist = {
-        'ANYONE', 'PLEASE', 'THANKS', 'UPDATE', 'POSTED', 'DELETE',
-        'THREAD', 'INVITE', 'WITHIN', 'SECOND', 'TRIPLE', 'PROMPT',
-        'OPENAI', 'REDDIT', 'REPORT', 'START', 'GIVING', 'TAKING',
-        'FRIEND', 'PEOPLE', 'PERSON', 'SINGLE', 'DOUBLE', 'FOLLOW',
-        'RECENT', 'RANDOM', 'PUBLIC', 'BUTTON', 'SUBMIT', 'CANCEL',
-        'TEST01', 'TEST02', 'DEMO01', 'SAMPLE', 'XXXXXX', 'ABCDEF',
-        '123456', 'ABC123', 'XYZ789', 'START1', 'ERROR1'
-    }
-    
-    if code_upper in blacklist:
+    if code_upper in CODE_BLACKLIST:
         return False, "blacklist"
     
     if code_upper.isalpha() or code_upper.isdigit():
@@ -373,16 +385,13 @@ def is_valid_code(code):
     
     return True, "valid"
 
-def get_image_urls_from_comment(comment):
-    """استخراج روابط الصور من Reddit"""
+def get_image_urls_from_text(text):
+    """استخراج روابط الصور من النص"""
     image_urls = []
     
     try:
-        url_pattern = re.compile(r'https?://[^\s<>"{}|\\^`\[\]]+')
-        urls = url_pattern.findall(comment.body)
-        
-        for url in urls:
-            if any(ext in url.lower() for ext in ['.jpg', '.jpeg', '.png', '.gif', '.webp']):
+        for url in URL_PATTERN.findall(text):
+            if any(ext in url.lower() for ext in IMAGE_EXTENSIONS):
                 image_urls.append(url)
             elif 'i.redd.it' in url or 'preview.redd.it' in url:
                 image_urls.append(url)
@@ -395,267 +404,351 @@ def get_image_urls_from_comment(comment):
     
     return image_urls
 
-def monitor_reddit_post(post_url):
-    """مراقبة منشور Reddit"""
-    print("Reddit Monitor Started")
-    print(f"OCR: {'Enabled' if OCR_ENABLED else 'Disabled'}")
-    print(f"Check Interval: 10 seconds")
+
+# حدث مرشح موحد تنتجه كل المصادر
+class CandidateEvent:
+    __slots__ = ('source', 'text', 'image_urls', 'permalink', 'created_time', 'from_image')
     
-    try:
-        submission = reddit.submission(url=post_url)
-        print(f"Connected to Reddit: {submission.title}")
-    except Exception as e:
-        print(f"Reddit Error: {e}")
-        return
+    def __init__(self, source, text, image_urls, permalink, created_time, from_image=False):
+        self.source = source
+        self.text = text
+        self.image_urls = image_urls
+        self.permalink = permalink
+        self.created_time = created_time
+        self.from_image = from_image
+
+# الواجهة الأساسية لمصادر الأكواد
+class SourceAdapter:
+    """
+    محول مصدر: يحول رسائل المنصة إلى CandidateEvent
     
-    loop_count = 0
+    - مصدر سحب (pull): يحدد poll_interval وينفذ poll() -> list[CandidateEvent]
+      ويشغله run_polling_adapter
+    - مصدر دفع (push): يترك poll_interval = None وينفذ run(pipeline)
+      ويرسل الأحداث عبر pipeline.submit(events)
     
-    while True:
-        try:
-            loop_count += 1
-            current_time = time.time()
-            stats['total_checks'] += 1
-            
-            if loop_count % 30 == 0:
-                print(f"Reddit Cycle #{loop_count} - {datetime.now().strftime('%H:%M:%S')}")
+    name و label و emoji تستخدم في السجلات و Telegram و Dashboard
+    """
+    name = None
+    label = None
+    emoji = "📡"
+    poll_interval = None
+    max_seen = 500
+    
+    def __init__(self):
+        self.seen_ids = set()
+    
+    @property
+    def log_tag(self):
+        return self.name.upper()
+    
+    def connect(self):
+        """تهيئة اختيارية قبل أول poll()"""
+        pass
+    
+    def poll(self):
+        raise NotImplementedError
+    
+    def run(self, pipeline):
+        raise NotImplementedError
+    
+    def mark_seen(self, item_id):
+        """يرجع False إذا تمت معالجة العنصر سابقاً"""
+        if item_id in self.seen_ids:
+            return False
+        
+        if len(self.seen_ids) >= self.max_seen:
+            self.seen_ids.clear()
+        
+        self.seen_ids.add(item_id)
+        return True
+    
+    def make_event(self, text, image_urls, permalink, created_time, from_image=False):
+        return CandidateEvent(self.name, text, image_urls, permalink, created_time, from_image)
+
+class CandidatePipeline:
+    """
+    خط معالجة واحد مشترك: استخراج، تصفية، تحقق، إحصائيات، إشعار
+    
+    worker النصوص هو الوحيد الذي يعدل sent_codes والإحصائيات.
+    طلبات OCR البطيئة تعمل في worker منفصل وترجع نتائجها كأحداث جديدة،
+    حتى لا تنتظر أكواد النصوص من أي مصدر صور مصدر آخر.
+    """
+    max_batch = 50
+    
+    def __init__(self, adapters):
+        self.adapters = {adapter.name: adapter for adapter in adapters}
+        self.queue = Queue()
+        self.ocr_queue = Queue()
+    
+    def submit(self, events):
+        """نقطة الدخول الوحيدة للمصادر: تضع الأحداث في الطابور"""
+        for event in events:
+            self.queue.put(event)
+    
+    def start_sources(self):
+        """تشغيل كل محول في thread خاص به"""
+        for adapter in self.adapters.values():
+            if adapter.poll_interval:
+                thread = Thread(target=run_polling_adapter, args=(adapter, self), daemon=True)
+            else:
+                thread = Thread(target=adapter.run, args=(self,), daemon=True)
+            thread.start()
+    
+    def run(self):
+        """worker النصوص: يفرغ الطابور على دفعات"""
+        Thread(target=self.run_ocr, daemon=True).start()
+        
+        while True:
+            batch = [self.queue.get()]
             
-            submission = reddit.submission(url=post_url)
-            submission.comment_sort = 'new'
-            submission.comments.replace_more(limit=0)
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except Empty:
+                    break
             
-            all_comments = list(submission.comments)
+            try:
+                self.process_batch(batch)
+            except Exception as e:
+                print(f"Pipeline Error: {e}")
+            finally:
+                for _ in batch:
+                    self.queue.task_done()
+    
+    def run_ocr(self):
+        """worker الـ OCR: كل صورة ترجع كحدث نصي إلى الطابور الرئيسي"""
+        while True:
+            event = self.ocr_queue.get()
             
-            for comment in all_comments[:20]:
-                if comment.id in processed_comments:
-                    continue
-                
-                time_diff = current_time - comment.created_utc
-                seconds_ago = int(time_diff)
-                
-                if seconds_ago > 120:
-                    continue
-                
-                processed_comments.add(comment.id)
-                
-                text_codes = CODE_PATTERN.findall(comment.body)
-                
-                for code in text_codes:
-                    code_upper = code.upper()
-                    
-                    if code_upper in sent_codes:
-                        continue
+            try:
+                for img_url in event.image_urls:
+                    ocr_text = extract_text_from_image(img_url)
                     
-                    sent_codes.add(code_upper)
-                    
-                    is_valid, reason = is_valid_code(code)
-                    
-                    if not is_valid:
-                        stats['codes_rejected'] += 1
-                        sent_codes.remove(code_upper)
-                        continue
-                    
-                    comment_url = f"https://reddit.com{comment.permalink}"
-                    
-                    if send_telegram_message(code_upper, comment_url, seconds_ago, "reddit"):
-                        stats['codes_sent'] += 1
-                        stats['reddit_codes'] += 1
-                        stats['last_code_time'] = datetime.now()
-                        stats['codes_list'].append(code_upper)
-                        print(f"     [REDDIT] CODE: {code_upper}")
-                    else:
-                        sent_codes.remove(code_upper)
-                
-                if OCR_ENABLED:
-                    image_urls = get_image_urls_from_comment(comment)
-                    
-                    for img_url in image_urls[:2]:
-                        try:
-                            ocr_text = extract_text_from_image(img_url)
-                            
-                            if not ocr_text:
-                                continue
-                            
-                            image_codes = CODE_PATTERN.findall(ocr_text)
-                            
-                            for code in image_codes:
-                                code_upper = code.upper()
-                                
-                                if code_upper in sent_codes:
-                                    continue
-                                
-                                sent_codes.add(code_upper)
-                                
-                                is_valid, reason = is_valid_code(code)
-                                
-                                if not is_valid:
-                                    stats['codes_rejected'] += 1
-                                    sent_codes.remove(code_upper)
-                                    continue
-                                
-                                comment_url = f"https://reddit.com{comment.permalink}"
-                                
-                                if send_telegram_message(code_upper, comment_url, seconds_ago, "reddit"):
-                                    stats['codes_sent'] += 1
-                                    stats['reddit_codes'] += 1
-                                    stats['last_code_time'] = datetime.now()
-                                    stats['codes_list'].append(code_upper)
-                                    print(f"     [REDDIT-IMG] CODE: {code_upper}")
-                                else:
-                                    sent_codes.remove(code_upper)
-                        except:
-                            pass
+                    if ocr_text:
+                        self.submit([self.adapters[event.source].make_event(
+                            ocr_text, (), event.permalink, event.created_time, from_image=True
+                        )])
+            finally:
+                self.ocr_queue.task_done()
+    
+    def process_batch(self, events):
+        """معالجة دفعة من الأحداث: النصوص فوراً، والصور تذهب لطابور OCR"""
+        now = time.time()
+        
+        for event in events:
+            if event.text:
+                self._handle_text(event, now)
+            
+            if OCR_ENABLED and event.image_urls:
+                self.ocr_queue.put(event)
+    
+    def _handle_text(self, event, now):
+        adapter = self.adapters[event.source]
+        seconds_ago = int(now - event.created_time)
+        
+        for code in CODE_PATTERN.findall(event.text):
+            code_upper = code.upper()
             
-            if len(processed_comments) > 500:
-                processed_comments.clear()
+            if code_upper in sent_codes:
+                continue
             
-            time.sleep(10)
+            is_valid, reason = is_valid_code(code_upper)
             
+            if not is_valid:
+                stats['codes_rejected'] += 1
+                continue
+            
+            if send_telegram_message(code_upper, event.permalink, seconds_ago, adapter.emoji, adapter.label):
+                sent_codes.add(code_upper)
+                stats['codes_sent'] += 1
+                stats[f"{adapter.name}_codes"] = stats.get(f"{adapter.name}_codes", 0) + 1
+                stats['last_code_time'] = datetime.now()
+                stats['codes_list'].append(code_upper)
+                print(f"     [{adapter.log_tag}{'-IMG' if event.from_image else ''}] CODE: {code_upper}")
+
+# محول Reddit (مصدر سحب)
+class RedditAdapter(SourceAdapter):
+    name = 'reddit'
+    label = 'Reddit'
+    emoji = "🔴"
+    poll_interval = 10
+    max_comments = 20
+    max_age = 120
+    max_images = 2
+    
+    def __init__(self, post_url):
+        super().__init__()
+        self.post_url = post_url
+    
+    def connect(self):
+        submission = reddit.submission(url=self.post_url)
+        print(f"Connected to Reddit: {submission.title}")
+    
+    def poll(self):
+        """جلب أحدث التعليقات وإرجاعها كدفعة أحداث"""
+        current_time = time.time()
+        
+        submission = reddit.submission(url=self.post_url)
+        submission.comment_sort = 'new'
+        submission.comments.replace_more(limit=0)
+        
+        events = []
+        
+        for comment in list(submission.comments)[:self.max_comments]:
+            if current_time - comment.created_utc > self.max_age:
+                continue
+            
+            if not self.mark_seen(comment.id):
+                continue
+            
+            events.append(self.make_event(
+                comment.body,
+                get_image_urls_from_text(comment.body)[:self.max_images],
+                f"https://reddit.com{comment.permalink}",
+                comment.created_utc
+            ))
+        
+        return events
+
+# محول Discord (مصدر دفع)
+class DiscordAdapter(SourceAdapter):
+    name = 'discord'
+    label = 'Discord'
+    emoji = "💜"
+    
+    def __init__(self, token, channel_id):
+        super().__init__()
+        self.token = token
+        self.channel_id = channel_id
+    
+    def to_event(self, message):
+        """تحويل رسالة Discord إلى حدث، أو None إذا لم تكن مطلوبة"""
+        if message.channel.id != self.channel_id:
+            return None
+        
+        if not self.mark_seen(message.id):
+            return None
+        
+        if hasattr(message, 'guild') and message.guild:
+            message_url = f"https://discord.com/channels/{message.guild.id}/{message.channel.id}/{message.id}"
+        else:
+            message_url = f"https://discord.com/channels/@me/{message.channel.id}/{message.id}"
+        
+        image_urls = []
+        for attachment in message.attachments:
+            if attachment.filename.lower().endswith(IMAGE_EXTENSIONS):
+                image_urls.append(attachment.url)
+        
+        return self.make_event(
+            message.content,
+            image_urls,
+            message_url,
+            message.created_at.timestamp()
+        )
+    
+    def run(self, pipeline):
+        """تشغيل Discord Self-Bot في thread منفصل، مع إعادة الاتصال عند الانقطاع"""
+        retry_delay = RETRY_DELAY
+        
+        while True:
+            asyncio.run(self._start(pipeline))
+            print(f"Discord Self-Bot disconnected, retrying in {retry_delay}s")
+            time.sleep(retry_delay)
+            retry_delay = min(retry_delay * 2, MAX_RETRY_DELAY)
+    
+    async def _start(self, pipeline):
+        client = DiscordSelfBot(self, pipeline)
+        try:
+            await client.start(self.token, bot=False)
         except Exception as e:
-            print(f"Reddit Error: {e}")
-            time.sleep(30)
+            print(f"Discord Self-Bot Error: {e}")
 
 # Discord Self-Bot
 class DiscordSelfBot(discord.Client):
-    def __init__(self):
+    def __init__(self, adapter, pipeline):
         super().__init__()
+        self.adapter = adapter
+        self.pipeline = pipeline
     
     async def on_ready(self):
         print(f'Discord Self-Bot Connected: {self.user}')
-        print(f'Monitoring Channel ID: {DISCORD_CHANNEL_ID}')
+        print(f'Monitoring Channel ID: {self.adapter.channel_id}')
     
     async def on_message(self, message):
         if message.author == self.user:
             return
         
-        if message.channel.id != DISCORD_CHANNEL_ID:
-            return
+        event = self.adapter.to_event(message)
         
-        if message.id in processed_discord_messages:
+        if event is None:
             return
         
-        processed_discord_messages.add(message.id)
-        
-        current_time = datetime.now(message.created_at.tzinfo)
-        time_diff = (current_time - message.created_at).total_seconds()
-        
         print(f"[DISCORD] New message from {message.author}")
         
-        text_codes = CODE_PATTERN.findall(message.content)
-        
-        for code in text_codes:
-            code_upper = code.upper()
-            
-            if code_upper in sent_codes:
-                continue
-            
-            sent_codes.add(code_upper)
+        self.pipeline.submit([event])
+
+def run_polling_adapter(adapter, pipeline):
+    """حلقة سحب عامة لأي مصدر يحدد poll_interval"""
+    print(f"{adapter.label} Monitor Started")
+    print(f"Check Interval: {adapter.poll_interval} seconds")
+    
+    retry_delay = RETRY_DELAY
+    while True:
+        try:
+            adapter.connect()
+            break
+        except Exception as e:
+            print(f"{adapter.label} Error: {e}")
+            print(f"{adapter.label} retrying in {retry_delay}s")
+            time.sleep(retry_delay)
+            retry_delay = min(retry_delay * 2, MAX_RETRY_DELAY)
+    
+    loop_count = 0
+    
+    while True:
+        try:
+            loop_count += 1
+            with stats_lock:
+                stats['total_checks'] += 1
             
-            is_valid, reason = is_valid_code(code)
+            if loop_count % 30 == 0:
+                print(f"{adapter.label} Cycle #{loop_count} - {datetime.now().strftime('%H:%M:%S')}")
             
-            if not is_valid:
-                stats['codes_rejected'] += 1
-                sent_codes.remove(code_upper)
-                continue
+            pipeline.submit(adapter.poll())
             
-            if hasattr(message, 'guild') and message.guild:
-                message_url = f"https://discord.com/channels/{message.guild.id}/{message.channel.id}/{message.id}"
-            else:
-                message_url = f"https://discord.com/channels/@me/{message.channel.id}/{message.id}"
+            time.sleep(adapter.poll_interval)
             
-            if send_telegram_message(code_upper, message_url, int(time_diff), "discord"):
-                stats['codes_sent'] += 1
-                stats['discord_codes'] += 1
-                stats['last_code_time'] = datetime.now()
-                stats['codes_list'].append(code_upper)
-                print(f"     [DISCORD] CODE: {code_upper}")
-            else:
-                sent_codes.remove(code_upper)
-        
-        if OCR_ENABLED and message.attachments:
-            for attachment in message.attachments:
-                if any(attachment.filename.lower().endswith(ext) for ext in ['.jpg', '.jpeg', '.png', '.gif', '.webp']):
-                    try:
-                        print(f"     [DISCORD] Scanning image: {attachment.filename}")
-                        ocr_text = extract_text_from_image(attachment.url)
-                        
-                        if not ocr_text:
-                            continue
-                        
-                        image_codes = CODE_PATTERN.findall(ocr_text)
-                        
-                        for code in image_codes:
-                            code_upper = code.upper()
-                            
-                            if code_upper in sent_codes:
-                                continue
-                            
-                            sent_codes.add(code_upper)
-                            
-                            is_valid, reason = is_valid_code(code)
-                            
-                            if not is_valid:
-                                stats['codes_rejected'] += 1
-                                sent_codes.remove(code_upper)
-                                continue
-                            
-                            if hasattr(message, 'guild') and message.guild:
-                                message_url = f"https://discord.com/channels/{message.guild.id}/{message.channel.id}/{message.id}"
-                            else:
-                                message_url = f"https://discord.com/channels/@me/{message.channel.id}/{message.id}"
-                            
-                            if send_telegram_message(code_upper, message_url, int(time_diff), "discord"):
-                                stats['codes_sent'] += 1
-                                stats['discord_codes'] += 1
-                                stats['last_code_time'] = datetime.now()
-                                stats['codes_list'].append(code_upper)
-                                print(f"     [DISCORD-IMG] CODE: {code_upper}")
-                            else:
-                                sent_codes.remove(code_upper)
-                    except Exception as e:
-                        print(f"     [DISCORD] OCR Error: {e}")
-        
-        if len(processed_discord_messages) > 500:
-            processed_discord_messages.clear()
-
-async def start_discord_selfbot():
-    """بدء Discord Self-Bot"""
-    client = DiscordSelfBot()
-    try:
-        await client.start(DISCORD_USER_TOKEN, bot=False)
-    except Exception as e:
-        print(f"Discord Self-Bot Error: {e}")
-
-def run_discord_selfbot():
-    """تشغيل Discord Self-Bot في thread منفصل"""
-    asyncio.run(start_discord_selfbot())
+        except Exception as e:
+            print(f"{adapter.label} Error: {e}")
+            time.sleep(30)
 
 if __name__ == "__main__":
-    # HTTP Server
-    http_thread = Thread(target=start_http_server, daemon=True)
-    http_thread.start()
+    POST_URL = "https://www.reddit.com/r/OpenAI/comments/1nz31om/new_sora_2_invite_code_megathread/"
+    
+    adapters = [RedditAdapter(POST_URL)]
     
     # Discord Self-Bot (إذا كان Token موجود)
     if DISCORD_USER_TOKEN and DISCORD_USER_TOKEN != 'your_discord_user_token':
-        discord_thread = Thread(target=run_discord_selfbot, daemon=True)
-        discord_thread.start()
+        adapters.append(DiscordAdapter(DISCORD_USER_TOKEN, DISCORD_CHANNEL_ID))
         print("Discord Self-Bot starting...")
     else:
         print("Discord monitoring disabled (no token provided)")
     
-    # Reddit Monitor (main thread)
-    POST_URL = "https://www.reddit.com/r/OpenAI/comments/1nz31om/new_sora_2_invite_code_megathread/"
+    pipeline = CandidatePipeline(adapters)
+    
+    # HTTP Server
+    HealthCheckHandler.adapters = tuple(pipeline.adapters.values())
+    http_thread = Thread(target=start_http_server, daemon=True)
+    http_thread.start()
     
     print("Initializing Multi-Source Monitor...")
     print(f"OCR: {'Enabled' if OCR_ENABLED else 'Disabled'}")
-    time.sleep(3)
     
-    retry_count = 0
-    while retry_count < 10:
-        try:
-            monitor_reddit_post(POST_URL)
-        except KeyboardInterrupt:
-            break
-        except Exception as e:
-            retry_count += 1
-            print(f"Fatal: {e}")
-            time.sleep(60)
+    pipeline.start_sources()
+    
+    # Pipeline worker (main thread)
+    try:
+        pipeline.run()
+    except KeyboardInterrupt:
+        pass